@@ -41,6 +41,13 @@ os.makedirs(model_path, exist_ok=True)
 __Lens_x3__
 
 The group consists of three lens galaxies whose total mass distributions are `IsothermalSph` models.
+
+All three lens galaxies are at the same redshift (`redshift=0.5`), meaning they are all in the same lens plane. When 
+ray-tracing, the deflection angles of every mass profile in this plane are summed and subtracted from the image-plane 
+grid in one step, as opposed to ray-tracing through a separate plane for each lens galaxy. 
+
+If you adapt this script to your own group, you should therefore only put lens galaxies at different redshifts if 
+you genuinely want to perform multi-plane ray-tracing, as it is slower and the lens model more complex.
 """
 mass = af.Model(al.mp.IsothermalSph)
 
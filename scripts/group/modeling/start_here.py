@@ -96,6 +96,16 @@ source-plane.
 Checkout the script ? for a complete description of this object, we will use the default `PositionSolver` in this 
 example with a `point_scale_precision` half the value of the position noise-map, which should be sufficiently good 
 enough precision to fit the lens model accurately.
+
+The grid is created once below and stored in the `PointSolver`, which is passed to the `AnalysisPoint`. Every 
+likelihood evaluation of the non-linear search therefore reuses this same grid (and the `PointDict` loaded above), 
+meaning neither the .fits / .json files are reloaded nor the grid recomputed for every lens model that is fitted.
+
+__Numba Caching__
+
+Some functions in the **PyAutoLens** libraries are compiled with the library `numba`, which takes time the first 
+time they are called. The `numba` section of the config file `config/general.yaml` therefore has `cache: true`, which 
+caches the compiled functions to hard-disk so that subsequent runs of this script skip this compilation.
 """
 grid = al.Grid2D.uniform(shape_native=data.shape_native, pixel_scales=data.pixel_scales)
 
@@ -147,8 +157,13 @@ the positions are fitted in the image-plane, by mapping the source-plane back to
 and iteratively searching for the best-fit solution.
 
 The ``PointSourceChi`` object instead fits the positions directly in the source-plane, by mapping the image-plane
-positions to the source just one. This is a much faster way to fit the positions,and for group scale lenses it
-typically sufficient to infer an accurate lens model.
+positions to the source-plane just once. This is a much faster way to fit the positions, and for group scale lenses it
+is typically sufficient to infer an accurate lens model.
+
+For every lens model, the source-plane chi-squared therefore only requires the deflection angles of the lens galaxies
+to be computed once at each observed (y,x) image-plane position, with the traced positions compared to the 
+source's `centre`. No iterative search over the image-plane grid is performed, which is why the likelihood 
+evaluation time of this model is so fast.
 """
 print(model.info)
 
@@ -215,6 +230,14 @@ computer. If you know that your processor is a quad-core processor you should be
 Above `number_of_cores=4` the speed-up from parallelization diminishes greatly. We therefore recommend you do not
 use a value above this.
 
+The likelihood evaluation time of this point-source model is extremely fast (see __Run Times__ below), meaning 
+that for `number_of_cores>1` much of the run time is spent passing information between processes. If you have many 
+group datasets to fit and many CPUs available, it is therefore more efficient to fit each dataset on a single CPU, 
+with many datasets fitted at once (e.g. by running this script multiple times with a different `dataset_name`). The 
+script `autolens_workspace/*/misc/hpc/cosma/example_0.py` shows how to do this on a super computer, including 
+setting the environment variables (e.g. `OMP_NUM_THREADS=1`) which stop each fit's NumPy calculations using 
+multiple CPUs.
+
 For users on a Windows Operating system, using `number_of_cores>1` may lead to an error, in which case it should be 
 reduced back to 1 to fix it.
 """
@@ -250,6 +273,11 @@ Run times are dictated by two factors:
 
 The log likelihood evaluation time can be estimated before a fit using the `profile_log_likelihood_function` method,
 which returns two dictionaries containing the run-times and information about the fit.
+
+Profiling performs its own likelihood evaluation(s) (the number is set by `repeats` in the `profiling` section of 
+the `config/general.yaml` config file) before the model-fit begins. It is not required to perform the model-fit, 
+so once you are happy with the run time of your lens model you can remove this step (and the run time estimate below) 
+from your own scripts.
 """
 run_time_dict, info_dict = analysis.profile_log_likelihood_function(
     instance=model.random_instance()
@@ -197,13 +197,17 @@ print(model.info)
 """
 We can now create this custom search and run it. Our non-linear search will now start by sampling higher likelihood 
 regions of parameter space, given our improved and more informed priors.
+
+The `number_of_cores` input was explained in tutorial 2. All three approaches in this tutorial use a Nautilus search 
+with `number_of_cores=4`, so that it samples multiple lens models at once in parallel. If your CPU has fewer cores, or 
+you are on a Windows Operating system and this leads to an error, reduce this value (back to 1 if necessary).
 """
 search = af.Nautilus(
     path_prefix=path.join("howtolens", "chapter_2"),
     name="tutorial_4_custom_priors",
     unique_tag=dataset_name,
     n_live=150,
-    number_of_cores=1,
+    number_of_cores=4,
 )
 
 analysis = al.AnalysisImaging(dataset=dataset)
@@ -214,16 +218,21 @@ __Run Time__
 The run time of the `log_likelihood_function` is around the usual value. 
 
 Due to prior tuning, the model-fit should take less than 10000 iterations per free parameter to converge.
+
+The run time of the `log_likelihood_function` depends on the dataset and mask (e.g. the number of image pixels and the
+PSF convolution), not on the values of the lens model parameters. We therefore profile it once here and store it 
+as `fit_time`, which the run time estimates of the other approaches below reuse.
 """
 run_time_dict, info_dict = analysis.profile_log_likelihood_function(
     instance=model.random_instance()
 )
 
-print(f"Log Likelihood Evaluation Time (second) = {run_time_dict['fit_time']}")
+fit_time = run_time_dict["fit_time"]
+
+print(f"Log Likelihood Evaluation Time (second) = {fit_time}")
 print(
     "Estimated Run Time Upper Limit (seconds) = ",
-    (run_time_dict["fit_time"] * model.total_free_parameters * 10000)
-    / search.number_of_cores,
+    (fit_time * model.total_free_parameters * 10000) / search.number_of_cores,
 )
 
 """
@@ -276,12 +285,16 @@ The non-linear search may fail because the lens model is too complex, making its
 sample accurately. Can we can make the lens model less complex, whilst keeping it realistic enough to perform our 
 scientific study? What assumptions can we make to reduce the number of a model parameters and therefore 
 dimensionality of non-linear parameter space?
+
+First, we again assume the lens is a massive elliptical galaxy, but rather than placing a prior near 4 on its 
+`sersic_index` we fix it to exactly 4 by using a `DevVaucouleurs` light profile. This removes a parameter from the 
+lens model, reducing the dimensionality of non-linear parameter space.
 """
-bulge = af.Model(al.lp.Sersic)
+bulge = af.Model(al.lp.DevVaucouleurs)
 mass = af.Model(al.mp.Isothermal)
 
 """
-First, we create a search that assumes that light-traces-mass. That  is, the light profile centre and elliptical 
+Next, we create a search that assumes that light-traces-mass. That  is, the light profile centre and elliptical 
 components are perfectly aligned with the centre and elliptical components of the mass profile. This may, or may 
 not, be a reasonable assumption, but it`ll remove 4 parameters from the lens model (the centre and elliptical 
 components of the mass profile), so it is worth trying!
@@ -294,7 +307,7 @@ mass.centre = bulge.centre
 mass.ell_comps = bulge.ell_comps
 
 """
-We now compose the model, which will have a non-linear parameter space with 4 less dimensions than the fit performed
+We now compose the model, which will have a non-linear parameter space with 5 less dimensions than the fit performed
 previously. 
 """
 lens = af.Model(
@@ -318,26 +331,21 @@ search = af.Nautilus(
     name="tutorial_4_reducing_complexity",
     unique_tag=dataset_name,
     n_live=200,
-    number_of_cores=1,
+    number_of_cores=4,
 )
 
 """
 __Run Time__
 
-The run time of the `log_likelihood_function` is around the usual value. 
+The run time of the `log_likelihood_function` is the `fit_time` profiled above, as the dataset and mask are unchanged. 
 
 Due to the simplest model parameterization, the model-fit should take less than 10000 iterations per free parameter to 
 converge.
 """
-run_time_dict, info_dict = analysis.profile_log_likelihood_function(
-    instance=model.random_instance()
-)
-
-print(f"Log Likelihood Evaluation Time (second) = {run_time_dict['fit_time']}")
+print(f"Log Likelihood Evaluation Time (second) = {fit_time}")
 print(
     "Estimated Run Time Upper Limit (seconds) = ",
-    (run_time_dict["fit_time"] * model.total_free_parameters * 10000)
-    / search.number_of_cores,
+    (fit_time * model.total_free_parameters * 10000) / search.number_of_cores,
 )
 
 """
@@ -393,11 +401,14 @@ Every non-linear search has settings which govern how thoroughly it searches par
 points that was passed to `Nautilus` an example of such a setting. The more thoroughly the search looks, the more likely 
 it is that it`ll find the global maximum lens model. However,  the search will also take longer!
 
-Below, we create a more thorough Nautilus search, that uses `n_live=200`. What these settings
+Below, we create a more thorough Nautilus search, that uses `n_live=300`. What these settings
 are actually changing is discussed in the optional tutorial `howtolens/chapter_optional/tutorial_searches.ipynb`.
+This tutorial also shows how to look harder using the nested sampler UltraNest with a `step sampler`, which samples 
+the broad priors of a model like the one below more efficiently by performing random walks between live points.
 
-Due to the long run times of this search, we comment it output below so it does not run. Feel free to undo these
-comments so the script runs faster.
+This search has the longest run time of the three approaches. If you are short on time, you can skip running it 
+and continue to the discussion below. Its run time estimate reuses the `fit_time` profiled earlier, so printing it 
+does not evaluate the likelihood function again.
 """
 lens = af.Model(
     al.Galaxy,
@@ -416,25 +427,20 @@ search = af.Nautilus(
     name="tutorial_4_look_harder",
     unique_tag=dataset_name,
     n_live=300,
-    number_of_cores=1,
+    number_of_cores=4,
 )
 """
 __Run Time__
 
-The run time of the `log_likelihood_function` is around the usual value. 
+The run time of the `log_likelihood_function` is again the `fit_time` profiled above. 
 
-Due to the more thorough Nautilus settings, the the model-fit should take more than 10000 iterations per free parameter 
-to converge and thus take longer than we are used too.
+Due to the more thorough Nautilus settings, the model-fit should take more than 10000 iterations per free parameter 
+to converge and thus take longer than we are used to.
 """
-run_time_dict, info_dict = analysis.profile_log_likelihood_function(
-    instance=model.random_instance()
-)
-
-print(f"Log Likelihood Evaluation Time (second) = {run_time_dict['fit_time']}")
+print(f"Log Likelihood Evaluation Time (second) = {fit_time}")
 print(
     "Estimated Run Time Upper Limit (seconds) = ",
-    (run_time_dict["fit_time"] * model.total_free_parameters * 10000)
-    / search.number_of_cores,
+    (fit_time * model.total_free_parameters * 10000) / search.number_of_cores,
 )
 
 """
@@ -93,25 +93,27 @@ source_galaxy_super_compact = al.Galaxy(
 )
 
 """
-The function below uses each source galaxy to simulate imaging data. It performs the usual tasks we are used to 
-seeing (make the PSF, galaxies, tracer, etc.).
+All 3 sources are simulated and fitted using the same grid, PSF and lens galaxy, so we create these once here and
+pass them to the functions below, rather than recreating them every time a function is called.
 """
+grid = al.Grid2D.uniform(shape_native=(150, 150), pixel_scales=0.05, sub_size=2)
 
+psf = al.Kernel2D.from_gaussian(shape_native=(11, 11), sigma=0.05, pixel_scales=0.05)
 
-def simulate_for_source_galaxy(source_galaxy):
-    grid = al.Grid2D.uniform(shape_native=(150, 150), pixel_scales=0.05, sub_size=2)
+lens_galaxy = al.Galaxy(
+    redshift=0.5,
+    mass=al.mp.Isothermal(
+        centre=(0.0, 0.0), ell_comps=(0.111111, 0.0), einstein_radius=1.6
+    ),
+)
 
-    psf = al.Kernel2D.from_gaussian(
-        shape_native=(11, 11), sigma=0.05, pixel_scales=0.05
-    )
+"""
+The function below uses each source galaxy to simulate imaging data. It performs the usual tasks we are used to 
+seeing (make the tracer, simulator, etc.).
+"""
 
-    lens_galaxy = al.Galaxy(
-        redshift=0.5,
-        mass=al.mp.Isothermal(
-            centre=(0.0, 0.0), ell_comps=(0.111111, 0.0), einstein_radius=1.6
-        ),
-    )
 
+def simulate_for_source_galaxy(source_galaxy, grid, psf, lens_galaxy):
     tracer = al.Tracer.from_galaxies(galaxies=[lens_galaxy, source_galaxy])
 
     simulator = al.SimulatorImaging(
@@ -137,15 +139,25 @@ mask = al.Mask2D.circular(
 """
 __Simulator__
 
-Now, lets simulate all 3 of our source's as to create `Imaging` data.
+Now, lets simulate all 3 of our source's as to create `Imaging` data, which we mask straight away.
 """
-dataset_source_flat = simulate_for_source_galaxy(source_galaxy=source_galaxy_flat)
+dataset_source_flat = simulate_for_source_galaxy(
+    source_galaxy=source_galaxy_flat, grid=grid, psf=psf, lens_galaxy=lens_galaxy
+)
+dataset_source_flat = dataset_source_flat.apply_mask(mask=mask)
 
-dataset_source_compact = simulate_for_source_galaxy(source_galaxy=source_galaxy_compact)
+dataset_source_compact = simulate_for_source_galaxy(
+    source_galaxy=source_galaxy_compact, grid=grid, psf=psf, lens_galaxy=lens_galaxy
+)
+dataset_source_compact = dataset_source_compact.apply_mask(mask=mask)
 
 dataset_source_super_compact = simulate_for_source_galaxy(
-    source_galaxy=source_galaxy_super_compact
+    source_galaxy=source_galaxy_super_compact,
+    grid=grid,
+    psf=psf,
+    lens_galaxy=lens_galaxy,
 )
+dataset_source_super_compact = dataset_source_super_compact.apply_mask(mask=mask)
 
 """
 __Fitting__
@@ -158,16 +170,9 @@ There is nothing new in this function you haven't seen before.
 """
 
 
-def fit_data_with_delaunay_magnification_pixelization(dataset, mask, coefficient):
-    dataset = dataset.apply_mask(mask=mask)
-
-    lens_galaxy = al.Galaxy(
-        redshift=0.5,
-        mass=al.mp.Isothermal(
-            centre=(0.0, 0.0), ell_comps=(0.111111, 0.0), einstein_radius=1.6
-        ),
-    )
-
+def fit_data_with_delaunay_magnification_pixelization(
+    dataset, lens_galaxy, coefficient
+):
     pixelization = al.Pixelization(
         mesh=al.mesh.DelaunayMagnification(shape=(30, 30)),
         regularization=al.reg.Constant(coefficient=coefficient),
@@ -187,7 +192,7 @@ Lets fit our first source which was simulated using the flattest light profile.
 highest regularization coefficient of our 3 fits (as determined by maximizing the Bayesian log evidence).
 """
 fit_flat = fit_data_with_delaunay_magnification_pixelization(
-    dataset=dataset_source_flat, mask=mask, coefficient=9.2
+    dataset=dataset_source_flat, lens_galaxy=lens_galaxy, coefficient=9.2
 )
 
 include = aplt.Include2D(mapper_image_plane_mesh_grid=True, mask=True)
@@ -206,7 +211,7 @@ lots of pixels! Nice!
 Now, lets fit the next source, which is more compact.
 """
 fit_compact = fit_data_with_delaunay_magnification_pixelization(
-    dataset=dataset_source_compact, mask=mask, coefficient=3.3
+    dataset=dataset_source_compact, lens_galaxy=lens_galaxy, coefficient=3.3
 )
 
 fit_plotter = aplt.FitImagingPlotter(fit=fit_compact, include_2d=include)
@@ -225,7 +230,7 @@ Finally, lets fit the very compact source. Given that the results for the compac
 be right in assuming this is just going to make things even worse. Again, think about why this might be.
 """
 fit_super_compact = fit_data_with_delaunay_magnification_pixelization(
-    dataset=dataset_source_super_compact, mask=mask, coefficient=3.1
+    dataset=dataset_source_super_compact, lens_galaxy=lens_galaxy, coefficient=3.1
 )
 
 fit_plotter = aplt.FitImagingPlotter(fit=fit_super_compact, include_2d=include)
@@ -172,6 +172,43 @@ print("Slow settings: ~500000")
 print(result_slow.samples.total_samples)
 print("Fast settings: ", result_fast.samples.total_samples)
 
+"""
+__UltraNest__
+
+Nautilus is not the only nested sampling algorithm supported by **PyAutoFit**. Another is UltraNest
+(https://johannesbuchner.github.io/UltraNest/readme.html), which is an optional library you may have to install 
+manually via the command `pip install ultranest`.
+
+When the priors on a lens model are broad and uninformative (for example when we "look harder" in chapter 2, 
+instead of tuning priors), UltraNest can be combined with a `step sampler`. Rather than drawing new live points 
+uniformly within a bound around the current live points, which becomes inefficient when parameters are highly 
+correlated (as they are for lens models), a step sampler performs a short random walk from an existing live point 
+to generate the new one. 
+
+Below, we use a `RegionSliceSampler` which performs `nsteps=25` slice sampling steps, in the region of parameter 
+space defined by the live points, for every new sample. UltraNest also supports MPI, meaning it can be run 
+over many CPUs on a super computer.
+
+Because UltraNest may not be installed, the code below is commented out. Once you have installed UltraNest, uncomment 
+it to perform the model-fit.
+"""
+# search = af.UltraNest(
+#     path_prefix=path.join("howtolens", "chapter_optional"),
+#     name="tutorial_searches_ultranest",
+#     unique_tag=dataset_name,
+#     stepsampler_cls="RegionSliceSampler",
+#     nsteps=25,
+#     number_of_cores=1,
+# )
+#
+# result_ultranest = search.fit(model=model, analysis=analysis)
+#
+# fit_plotter = aplt.FitImagingPlotter(fit=result_ultranest.max_log_likelihood_fit)
+# fit_plotter.subplot_fit()
+#
+# print("Total UltraNest Iterations:")
+# print(result_ultranest.samples.total_samples)
+
 """
 __Optimizers__
 
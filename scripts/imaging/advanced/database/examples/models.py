@@ -15,6 +15,7 @@ by the non-linear search.
 # %cd $workspace_path
 # print(f"Working Directory has been set to `{workspace_path}`")
 
+import numpy as np
 import autofit as af
 import autolens as al
 import autolens.plot as aplt
@@ -76,8 +77,11 @@ Each tracer has the information we need to compute the Einstein mass of a model.
 the Einstein mass of each of our most-likely lens galaxies.
 
 The model instance uses the model defined by a pipeline. In this pipeline, we called the lens galaxy `lens`.
+
+We reuse the `tracer_agg` created above, as it is tied to the same aggregator and therefore the same database 
+queries. Each call to one of its `_gen_from` methods returns a fresh generator, so it can be used as many times as
+we like.
 """
-tracer_agg = al.agg.TracerAgg(aggregator=agg)
 tracer_gen = tracer_agg.max_log_likelihood_gen_from()
 
 print("Maximum Log Likelihood Lens Einstein Masses:")
@@ -136,7 +140,6 @@ In order to use these samples in the function `quantile`, we also need the weigh
 compute this using the `TracerAgg`'s function `weights_above_gen_from`, which computes generators of the weights of all 
 points above this minimum value. This again ensures memory use in minimal.
 """
-tracer_agg = al.agg.TracerAgg(aggregator=agg)
 tracer_list_gen = tracer_agg.all_above_weight_gen_from(minimum_weight=1e-4)
 weight_list_gen = tracer_agg.weights_above_gen_from(minimum_weight=1e-4)
 
@@ -161,6 +164,54 @@ for tracer_gen, weight_gen in zip(tracer_list_gen, weight_list_gen):
 
     print(f"Axis-Ratio = {median_axis_ratio} ({upper_axis_ratio} {lower_axis_ratio}")
 
+"""
+__Errors (Without Tracers)__
+
+Creating a `Tracer` for every sample is the most expensive step above. The axis ratio only depends on the `ell_comps` 
+of the lens galaxy's mass, which are parameters sampled directly by the non-linear search, so we do not actually need 
+a `Tracer`, or even the galaxies of a model instance, to compute it.
+
+We instead load the `Samples` of every model-fit and read the `ell_comps` straight from the sampled parameters. The 
+`paths` of the model give the index of each parameter in `parameter_lists`, as shown in the 
+`imaging/results/examples/samples.py` example. We again discard samples with a weight below `minimum_weight=1e-4` and
+compute the axis ratio of every remaining sample with `al.convert.axis_ratio_from`.
+
+The `TracerAgg` remains the right tool for quantities which do need the `Tracer`, for example the Einstein mass 
+computed above.
+"""
+for samples in agg.values("samples"):
+    parameter_array = np.asarray(samples.parameter_lists)
+    weight_array = np.asarray(samples.weight_list)
+
+    paths = samples.model.paths
+
+    ell_comps_0_index = paths.index(
+        ("galaxies", "lens", "mass", "ell_comps", "ell_comps_0")
+    )
+    ell_comps_1_index = paths.index(
+        ("galaxies", "lens", "mass", "ell_comps", "ell_comps_1")
+    )
+
+    above_minimum_weight = weight_array > 1e-4
+
+    ell_comps_0 = parameter_array[above_minimum_weight, ell_comps_0_index]
+    ell_comps_1 = parameter_array[above_minimum_weight, ell_comps_1_index]
+
+    axis_ratio_list = [
+        al.convert.axis_ratio_from(ell_comps=(ell_comps_0_value, ell_comps_1_value))
+        for ell_comps_0_value, ell_comps_1_value in zip(ell_comps_0, ell_comps_1)
+    ]
+
+    median_axis_ratio, upper_axis_ratio, lower_axis_ratio = af.marginalize(
+        parameter_list=axis_ratio_list,
+        sigma=3.0,
+        weight_list=list(weight_array[above_minimum_weight]),
+    )
+
+    print(
+        f"Axis-Ratio (from samples) = {median_axis_ratio} ({upper_axis_ratio} {lower_axis_ratio}"
+    )
+
 """
 __Errors (Random draws from PDF)__
 
@@ -171,7 +222,6 @@ as the method above. However, it can be difficult to be certain how many random
 The weights of each sample are used to make every random draw. Therefore, when we compute the axis-ratio and its errors
 we no longer need to pass the `weight_list` to the `quantile` function.
 """
-tracer_agg = al.agg.TracerAgg(aggregator=agg)
 tracer_list_gen = tracer_agg.randomly_drawn_via_pdf_gen_from(total_samples=2)
 
 for tracer_gen in tracer_list_gen:
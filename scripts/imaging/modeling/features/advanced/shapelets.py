@@ -141,25 +141,16 @@ lens = af.Model(al.Galaxy, redshift=0.5, mass=mass, shear=shear)
 # Source:
 
 total_n = 10
-total_m = sum(range(2, total_n + 1)) + 1
+
+nm_list = [(n, m) for n in range(1, total_n + 1) for m in range(-n, n + 1, 2)]
 
 shapelets_bulge_list = af.Collection(
-    af.Model(al.lp_shapelets.ShapeletPolar) for _ in range(total_n + total_m)
+    af.Model(al.lp_shapelets.ShapeletPolar) for _ in nm_list
 )
 
-n_count = 1
-m_count = -1
-
-for i, shapelet in enumerate(shapelets_bulge_list):
-    shapelet.n = n_count
-    shapelet.m = m_count
-
-    m_count += 2
-
-    if m_count > n_count:
-        n_count += 1
-        m_count = -n_count
-
+for shapelet, (n, m) in zip(shapelets_bulge_list, nm_list):
+    shapelet.n = n
+    shapelet.m = m
     shapelet.centre = shapelets_bulge_list[0].centre
     shapelet.beta = shapelets_bulge_list[0].beta
 
@@ -246,6 +237,11 @@ search = af.Nautilus(
 __Analysis__
 
 Create the `AnalysisImaging` object defining how the via Nautilus the model is fitted to the data.
+
+We input `use_w_tilde=False`. The `w_tilde` formalism speeds up inversions which use a pixelization, by precomputing
+how the PSF and noise-map couple every pair of image pixels. The shapelets are instead linear light profiles, whose
+images depend on the non-linear `centre` and `beta` parameters and so must be computed and blurred with the PSF for 
+every model. The `w_tilde` formalism therefore offers no speed up and we do not spend time precomputing it.
 """
 analysis = al.AnalysisImaging(
     dataset=dataset, settings_inversion=al.SettingsInversion(use_w_tilde=False)
@@ -325,14 +321,18 @@ I have not seen this model used in the literature, and am not clear on its advan
 model. However, it is worth trying if you are fitting a lens galaxy with a complex morphology.
 
 For most massive early-type galaxies, an MGE model will be faster and give higher quality results.
-"""
-# Lens:
 
+The lens and source below are both composed from the same `shapelets_bulge_list`, and therefore share the same 
+shapelet `centre` and `beta` priors. We therefore compose the `Basis` once and pass it to both galaxies. To give the 
+lens and source independent shapelet parameters, create a second list of shapelets in the same way as above.
+"""
 bulge = af.Model(
     al.lp_basis.Basis,
     light_profile_list=shapelets_bulge_list,
 )
 
+# Lens:
+
 mass = af.Model(al.mp.Isothermal)
 
 shear = af.Model(al.mp.ExternalShear)
@@ -341,11 +341,6 @@ lens = af.Model(al.Galaxy, redshift=0.5, bulge=bulge, mass=mass, shear=shear)
 
 # Source:
 
-bulge = af.Model(
-    al.lp_basis.Basis,
-    light_profile_list=shapelets_bulge_list,
-)
-
 source = af.Model(al.Galaxy, redshift=1.0, bulge=bulge)
 
 # Overall Lens Model:
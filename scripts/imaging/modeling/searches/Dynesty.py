@@ -117,6 +117,41 @@ parameter in 1D and 2D.
 search_plotter = aplt.DynestyPlotter(samples=result.samples)
 search_plotter.cornerplot()
 
+"""
+__Dynamic Nested Sampling__
+
+Dynesty also supports dynamic nested sampling, via the `DynestyDynamic` search. 
+
+Static nested sampling uses a fixed number of live points throughout the fit. Dynamic nested sampling first runs
+a quick initial static run with a small number of live points, and then adds batches of live points to the regions
+of parameter space which contribute most to the posterior. For a well constrained lens model this requires fewer
+likelihood evaluations to estimate the posterior to the same accuracy.
+
+There are a few inputs worth noting:
+
+- `nlive_init=50`: The number of live points used by the initial static run, which is the same as the static search 
+  above.
+- `dlogz_init=0.5`: The initial static run terminates at a looser tolerance on the evidence, with the remaining 
+  sampling performed by the batches of live points added thereafter.
+- `sample="rwalk"`: Random walk nested sampling is used, as above, because it is effective at lens modeling.
+"""
+search = af.DynestyDynamic(
+    path_prefix=path.join("searches"),
+    name="DynestyDynamic",
+    nlive_init=50,
+    dlogz_init=0.5,
+    sample="rwalk",
+    walks=10,
+    bound="multi",
+    iterations_per_update=2500,
+    number_of_cores=1,
+)
+
+result = search.fit(model=model, analysis=analysis)
+
+search_plotter = aplt.DynestyPlotter(samples=result.samples)
+search_plotter.cornerplot()
+
 """
 Finish.
 """
@@ -104,6 +104,9 @@ __Search__
 
 Below we use emcee to fit the lens model, using the model with start points as described above. See the Emcee docs
 for a description of what the input parameters below do.
+
+Every walker evaluates its likelihood independently at each step, so we set `number_of_cores=4` to evaluate the 
+likelihoods of the 30 walkers in parallel. 
 """
 search = af.Emcee(
     path_prefix=path.join("imaging", "searches"),
@@ -119,7 +122,7 @@ search = af.Emcee(
         change_threshold=0.01,
     ),
     iterations_per_update=5000,
-    number_of_cores=1,
+    number_of_cores=4,
 )
 
 result = search.fit(model=model, analysis=analysis)
@@ -70,6 +70,12 @@ grid = al.Grid2DIterate.uniform(
     sub_steps=[2, 4, 8, 16, 24],
 )
 
+"""
+For a faster run time, the tracer visualization uses the binned grid instead of the iterative grid. This is the same
+for every lens in the sample, so we compute it once here rather than for every simulated dataset.
+"""
+grid_binned = grid.binned
+
 """
 Simulate a simple Gaussian PSF for the image.
 """
@@ -122,10 +128,20 @@ Within a for loop, we will now generate instances of the lens and source galaxie
 This loop will run for `total_datasets` iterations, which sets the number of lenses that are simulated.
 
 Each iteration of the for loop will then create a tracer and use this to simulate the imaging dataset.
+
+Every iteration is independent of the others, so a large sample can be simulated in parallel by running multiple 
+copies of this script at once (e.g. as a job array on a super computer, see `misc/hpc/cosma/example_0.py`). Give 
+each copy a different `sample_index_start`, so that each simulates and outputs a different range of datasets.
+
+Plotting each dataset takes longer than simulating it, so for samples of hundreds or thousands of lenses most of the 
+run time is spent on visualization. Only datasets whose `sample_index` is a multiple of `plot_every` are plotted, 
+for example `plot_every = 50` plots every 50th dataset. The .fits and .json files of every dataset are always output.
 """
+sample_index_start = 0
 total_datasets = 3
+plot_every = 1
 
-for sample_index in range(total_datasets):
+for sample_index in range(sample_index_start, sample_index_start + total_datasets):
     dataset_sample_path = path.join(dataset_path, f"dataset_{sample_index}")
 
     lens_galaxy = lens.random_instance()
@@ -141,13 +157,17 @@ for sample_index in range(total_datasets):
     """
     tracer = al.Tracer.from_galaxies(galaxies=[lens_galaxy, source_galaxy])
 
-    tracer_plotter = aplt.TracerPlotter(tracer=tracer, grid=grid)
-    tracer_plotter.figures_2d(image=True)
+    plot_sample = sample_index % plot_every == 0
+
+    if plot_sample:
+        tracer_plotter = aplt.TracerPlotter(tracer=tracer, grid=grid)
+        tracer_plotter.figures_2d(image=True)
 
     dataset = simulator.via_tracer_from(tracer=tracer, grid=grid)
 
-    dataset_plotter = aplt.ImagingPlotter(dataset=dataset)
-    dataset_plotter.subplot_dataset()
+    if plot_sample:
+        dataset_plotter = aplt.ImagingPlotter(dataset=dataset)
+        dataset_plotter.subplot_dataset()
 
     """
     __Output__
@@ -168,21 +188,22 @@ for sample_index in range(total_datasets):
     
     Output a subplot of the simulated dataset, the image and the tracer's quantities to the dataset path as .png files.
 
-    For a faster run time, the tracer visualization uses the binned grid instead of the iterative grid.
+    For a faster run time, the tracer visualization uses the binned grid computed above.
     """
-    mat_plot = aplt.MatPlot2D(
-        output=aplt.Output(path=dataset_sample_path, format="png")
-    )
-
-    dataset_plotter = aplt.ImagingPlotter(dataset=dataset, mat_plot_2d=mat_plot)
-    dataset_plotter.subplot_dataset()
-    dataset_plotter.figures_2d(data=True)
-
-    tracer_plotter = aplt.TracerPlotter(
-        tracer=tracer, grid=grid.binned, mat_plot_2d=mat_plot
-    )
-    tracer_plotter.subplot_tracer()
-    tracer_plotter.subplot_plane_images()
+    if plot_sample:
+        mat_plot = aplt.MatPlot2D(
+            output=aplt.Output(path=dataset_sample_path, format="png")
+        )
+
+        dataset_plotter = aplt.ImagingPlotter(dataset=dataset, mat_plot_2d=mat_plot)
+        dataset_plotter.subplot_dataset()
+        dataset_plotter.figures_2d(data=True)
+
+        tracer_plotter = aplt.TracerPlotter(
+            tracer=tracer, grid=grid_binned, mat_plot_2d=mat_plot
+        )
+        tracer_plotter.subplot_tracer()
+        tracer_plotter.subplot_plane_images()
 
     """
     __Tracer json__
@@ -77,17 +77,6 @@ real_space_mask = al.Mask2D.circular(
 dataset_name = "dark_matter_subhalo"
 dataset_path = path.join("dataset", "interferometer", dataset_name)
 
-dataset = al.Interferometer.from_fits(
-    data_path=path.join(dataset_path, "data.fits"),
-    noise_map_path=path.join(dataset_path, "noise_map.fits"),
-    uv_wavelengths_path=path.join(dataset_path, "uv_wavelengths.fits"),
-    real_space_mask=real_space_mask,
-)
-
-dataset = dataset.apply_settings(
-    settings=al.SettingsInterferometer(transformer_class=al.TransformerDFT)
-)
-
 """
 __Inversion Settings (Run Times)__
 
@@ -105,24 +94,45 @@ The optimal settings depend on the number of visibilities in the dataset:
  - For  N_visibilities > ~10000: use `transformer_class=TransformerNUFFT`  and `use_linear_operators=True`.
 
 The dataset modeled by default in this script has just 200 visibilties, therefore `transformer_class=TransformerDFT`
-and `use_linear_operators=False`. If you are using this script to model your own dataset with a different number of
-visibilities, you should update the options below accordingly.
+and `use_linear_operators=False`. So that this script can be used to model your own dataset, the options below are 
+chosen using the number of visibilities in the dataset, switching to the NUFFT and linear operators above 1000 
+visibilities. Datasets with between ~1000 and ~10000 visibilities may be fastest with either choice.
 
 The script `autolens_workspace/*/interferometer/run_times.py` allows you to compute the run-time of an inversion
 for your interferometer dataset. It does this for all possible combinations of settings and therefore can tell you
 which settings give the fastest run times for your dataset.
+
+The number of visibilities is the number of `uv_wavelengths`, which we load first so that the settings are chosen 
+before the dataset itself is loaded.
 """
-settings_dataset = al.SettingsInterferometer(transformer_class=al.TransformerDFT)
-settings_inversion = al.SettingsInversion(use_linear_operators=False)
+uv_wavelengths = al.util.array_2d.numpy_array_2d_via_fits_from(
+    file_path=path.join(dataset_path, "uv_wavelengths.fits"), hdu=0
+)
+
+total_visibilities = uv_wavelengths.shape[0]
+
+if total_visibilities < 1000:
+    settings_dataset = al.SettingsInterferometer(transformer_class=al.TransformerDFT)
+    settings_inversion = al.SettingsInversion(use_linear_operators=False)
+else:
+    settings_dataset = al.SettingsInterferometer(transformer_class=al.TransformerNUFFT)
+    settings_inversion = al.SettingsInversion(use_linear_operators=True)
 
 """
-We now create the `Interferometer` object which is used to fit the lens model.
+We now load the `Interferometer` object which is used to fit the lens model.
 
 This includes a `SettingsInterferometer`, which includes the method used to Fourier transform the real-space 
-image of the strong lens to the uv-plane and compare directly to the visiblities. We use a non-uniform fast Fourier 
-transform, which is the most efficient method for interferometer datasets containing ~1-10 million visibilities.
+image of the strong lens to the uv-plane and compare directly to the visiblities. The settings chosen above are 
+applied straight after loading, so there is no separate, redundant DFT setup before the settings are known.
 """
+dataset = al.Interferometer.from_fits(
+    data_path=path.join(dataset_path, "data.fits"),
+    noise_map_path=path.join(dataset_path, "noise_map.fits"),
+    uv_wavelengths_path=path.join(dataset_path, "uv_wavelengths.fits"),
+    real_space_mask=real_space_mask,
+)
 dataset = dataset.apply_settings(settings=settings_dataset)
+
 dataset_plotter = aplt.InterferometerPlotter(dataset=dataset)
 dataset_plotter.subplot_dataset()
 dataset_plotter.subplot_dirty_images()
@@ -279,8 +289,23 @@ For this modeling script the SUBHALO PIPELINE customizes:
 
  - The [number_of_steps x number_of_steps] size of the grid-search, as well as the dimensions it spans in arc-seconds.
  - The `number_of_cores` used for the gridsearch, where `number_of_cores > 1` performs the model-fits in paralle using
- the Python multiprocessing module.
+ the Python multiprocessing module. 
+
+The grid search is the most expensive part of this script, so the SUBHALO PIPELINE is passed `settings_autofit_subhalo`, 
+which is the same as `settings_autofit` above but with `number_of_cores=4`. The 5 x 5 = 25 fits of the grid search 
+are independent of one another and are distributed over these cores, with each individual fit using a single core. 
+The SUBHALO PIPELINE's other two searches (the refit without a subhalo and the refinement of a detection) also use 
+4 cores, whereas every search of the earlier pipelines uses 1 core. Set this to the number of CPUs available on your 
+machine.
 """
+settings_autofit_subhalo = af.SettingsSearch(
+    path_prefix=path.join("interferometer", "slam"),
+    unique_tag=dataset_name,
+    info=None,
+    number_of_cores=4,
+    session=None,
+)
+
 analysis = al.AnalysisInterferometer(
     dataset=dataset,
     adapt_result=source_pix_results.last,
@@ -291,7 +316,7 @@ analysis = al.AnalysisInterferometer(
 )
 
 subhalo_results = slam.subhalo.detection(
-    settings_autofit=settings_autofit,
+    settings_autofit=settings_autofit_subhalo,
     analysis=analysis,
     mass_results=mass_results,
     subhalo_mass=af.Model(al.mp.NFWMCRLudlowSph),
@@ -83,7 +83,7 @@
 #
 # dataset_list = [
 #     dataset.apply_mask(mask=mask)
-#     for imaging, mask in zip(dataset_list, mask_list)
+#     for dataset, mask in zip(dataset_list, mask_list)
 # ]
 #
 # for dataset in dataset_list:
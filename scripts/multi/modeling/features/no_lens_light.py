@@ -82,7 +82,7 @@ mask_list = [
 
 
 dataset_list = [
-    dataset.apply_mask(mask=mask) for imaging, mask in zip(dataset_list, mask_list)
+    dataset.apply_mask(mask=mask) for dataset, mask in zip(dataset_list, mask_list)
 ]
 
 for dataset in dataset_list:
@@ -114,6 +114,11 @@ analysis = sum(analysis_list)
 """
 We can parallelize the likelihood function of these analysis classes, whereby each evaluation is performed on a 
 different CPU.
+
+For a small number of datasets whose likelihood functions are fast, as in this example, sending every likelihood 
+evaluation of each dataset to a different CPU has an overhead which is comparable to the evaluation itself. We 
+therefore instead parallelize the non-linear search below, which evaluates many lens models at once and uses 
+the CPUs more efficiently. Only one of the two forms of parallelization should be used at once.
 """
 analysis.n_cores = 1
 
@@ -153,13 +158,15 @@ analysis = analysis.with_free_parameters(model.galaxies.source.bulge.intensity)
 
 """
 __Search__
+
+The search uses `number_of_cores=4`, sampling 4 lens models in parallel, each of which fits every waveband.
 """
 search = af.Nautilus(
     path_prefix=path.join("multi", "modeling"),
     name="mass[sie]_source[bulge]2",
     unique_tag=dataset_name,
     n_live=100,
-    number_of_cores=1,
+    number_of_cores=4,
 )
 
 """
@@ -105,7 +105,7 @@ mask_list = [
 ]
 
 dataset_list = [
-    dataset.apply_mask(mask=mask) for imaging, mask in zip(dataset_list, mask_list)
+    dataset.apply_mask(mask=mask) for dataset, mask in zip(dataset_list, mask_list)
 ]
 
 for dataset in dataset_list:
@@ -109,8 +109,8 @@ the positions are fitted in the image-plane, by mapping the source-plane back to
 and iteratively searching for the best-fit solution.
 
 The `PointSourceChi` object instead fits the positions directly in the source-plane, by mapping the image-plane 
-positions to the source just one. This is a much faster way to fit the positions,and for group scale lenses it 
-typically sufficient to infer an accurate lens model.
+positions to the source-plane just once. This is a much faster way to fit the positions, and for group scale lenses it 
+is typically sufficient to infer an accurate lens model.
 
 __Search + Analysis + Model-Fit__
 
@@ -95,6 +95,20 @@ grid = al.Grid2D.uniform(shape_native=data.shape_native, pixel_scales=data.pixel
 
 point_solver = al.PointSolver(grid=grid, pixel_scale_precision=0.025)
 
+"""
+Search 1 only needs a reasonably accurate lens model, so it uses a `PointSolver` whose initial grid has half the 
+resolution of the data. The solver refines its solutions to the same `pixel_scale_precision`, but its run time is 
+faster because the coarser grid has 4 times fewer pixels to ray-trace.
+
+Search 2 uses the full resolution `point_solver` above.
+"""
+grid_coarse = al.Grid2D.uniform(
+    shape_native=(data.shape_native[0] // 2, data.shape_native[1] // 2),
+    pixel_scales=2.0 * data.pixel_scales[0],
+)
+
+point_solver_coarse = al.PointSolver(grid=grid_coarse, pixel_scale_precision=0.025)
+
 """
 __Model (Search 1)__
 
@@ -125,6 +139,11 @@ __Search + Analysis + Model-Fit (Search 1)__
 
 We now create the non-linear search, analysis and perform the model-fit using this model.
 
+Search 1 only needs to provide a reasonably accurate lens model to initialize search 2, therefore it uses fewer live 
+points than search 2. This gives a faster but less thorough sampling of its lower dimensionality parameter space.
+
+Both searches use `number_of_cores=1`, for the reasons explained in `group/modeling/start_here.py`.
+
 You may wish to inspect the results of the search 1 model-fit to ensure a fast non-linear search has been provided that 
 provides a reasonably accurate lens model.
 """
@@ -132,10 +151,11 @@ search_1 = af.Nautilus(
     path_prefix=path_prefix,
     name="search[1]__single_plane",
     unique_tag=dataset_name,
-    n_live=100,
+    n_live=50,
+    number_of_cores=1,
 )
 
-analysis_1 = al.AnalysisPoint(point_dict=point_dict, solver=point_solver)
+analysis_1 = al.AnalysisPoint(point_dict=point_dict, solver=point_solver_coarse)
 
 result_1 = search_1.fit(model=model_1, analysis=analysis_1)
 
@@ -195,6 +215,7 @@ search_2 = af.Nautilus(
     name="search[2]__double_plane",
     unique_tag=dataset_name,
     n_live=100,
+    number_of_cores=1,
 )
 
 analysis_2 = al.AnalysisPoint(point_dict=point_dict, solver=point_solver)